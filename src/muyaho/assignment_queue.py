@@ -1,6 +1,9 @@
 import datetime
+from dataclasses import dataclass, field
 from enum import Enum
 import copy
+import itertools
+from typing import Iterator, List, Optional
 from .circular_queue import CircularQueue
 
 class Date(Enum):
@@ -24,6 +27,18 @@ class AssignmentQueue:
         return f"마감일: {self.deadline.strftime('%Y-%m-%d')}"
 
 
+@dataclass
+class DayEvent:
+    """AssignmentManager 가 하루를 진행한 기록"""
+
+    date: datetime.date
+    added: List[AssignmentQueue] = field(default_factory=list)
+    completed: List[AssignmentQueue] = field(default_factory=list)
+    postponed: List[AssignmentQueue] = field(default_factory=list)
+    backlog: int = 0  # 그날이 끝난 뒤 남은 과제 수
+    took_leave: bool = False
+
+
 class AssignmentManager:
     def __init__(self):
         self.assignment_queue = CircularQueue()
@@ -35,25 +50,22 @@ class AssignmentManager:
         self.assignment_queue.enqueue(assignment)
         print(f"새 과제 추가: {assignment}")
 
-    def process_day(self) -> None:
-        if self.took_leave:
-            print("이미 휴학했습니다.")
-            return
-
+    def _step(self) -> "DayEvent":
+        """하루를 진행하고 무슨 일이 있었는지 반환 (출력 없음)"""
+        event = DayEvent(date=self.current_date)
         dow = self.current_date.weekday()  # 0=Mon,1=Tue,...
 
         # 1) 자동 과제 추가
-        if dow == 1:
-            self.add_task(Date.TUESDAY)
-        elif dow == 2:
-            self.add_task(Date.WEDNESDAY)
-        elif dow == 4:
-            self.add_task(Date.FRIDAY)
+        day = {1: Date.TUESDAY, 2: Date.WEDNESDAY, 4: Date.FRIDAY}.get(dow)
+        if day is not None:
+            assignment = AssignmentQueue(day, self.current_date)
+            self.assignment_queue.enqueue(assignment)
+            event.added.append(assignment)
 
         # 2) 큐 비어있으면 하루만 스킵
         if self.assignment_queue.is_empty():
             self.current_date += datetime.timedelta(days=1)
-            return
+            return event
 
         # 3) 오늘 처리할 과제들 모두 꺼내기
         tasks = []
@@ -63,29 +75,62 @@ class AssignmentManager:
 
         # 4) 과제 3개 이상이면 휴학
         if n >= 3:
-            print(f"과제 {n}개로 3개 이상이므로 휴학합니다.")
             self.took_leave = True
+            event.took_leave = True
             for t in tasks:
                 self.assignment_queue.enqueue(t)
-            return
+            event.backlog = n
+            return event
 
         # 5) 단일 과제이고 여유 >= 4일이면 3일 미루기
         if n == 1 and tasks[0].left_days(self.current_date) >= 4:
-            print("단일 과제이고 여유 있으니 3일 미룹니다.")
             self.assignment_queue.enqueue(tasks[0])
+            event.postponed.append(tasks[0])
+            event.backlog = 1
             self.current_date += datetime.timedelta(days=3)
-            return
+            return event
 
         # 6) 그 외(과제 2개 이하) → 기한 가까운 순 처리(최대 2개)
         tasks.sort(key=lambda t: t.left_days(self.current_date))
         cnt = min(2, n)
-        for i in range(cnt):
-            print(f"과제 완료: {tasks[i]}")
+        event.completed.extend(tasks[:cnt])
         for i in range(cnt, n):
             self.assignment_queue.enqueue(tasks[i])
+        event.backlog = self.assignment_queue.size()
 
         # 하루 경과
         self.current_date += datetime.timedelta(days=1)
+        return event
+
+    def _report(self, event: "DayEvent") -> None:
+        for assignment in event.added:
+            print(f"새 과제 추가: {assignment}")
+        if event.took_leave:
+            print(f"과제 {event.backlog}개로 3개 이상이므로 휴학합니다.")
+        elif event.postponed:
+            print("단일 과제이고 여유 있으니 3일 미룹니다.")
+        for t in event.completed:
+            print(f"과제 완료: {t}")
+
+    def iter_days(self, start: Optional[datetime.date] = None) -> Iterator["DayEvent"]:
+        """
+        하루씩 진행하면서 그날의 기록(DayEvent)을 내보내는 제너레이터
+        휴학하면 그날 기록을 내보내고 끝남, 이미 휴학했으면 아무것도 내보내지 않음
+
+        Args:
+            start: 시작 날짜 (주어지면 current_date 를 이 날짜로 바꿈)
+        """
+        if start is not None:
+            self.current_date = start
+        while not self.took_leave:
+            yield self._step()
+
+    def process_day(self) -> None:
+        if self.took_leave:
+            print("이미 휴학했습니다.")
+            return
+
+        self._report(self._step())
 
     def fast_forward(self, days: int) -> None:
         # 첫날에 큐가 비어 있으면 곧바로 days만큼 건너뜀
@@ -93,12 +138,15 @@ class AssignmentManager:
             self.current_date += datetime.timedelta(days=days)
             return
 
-        # 아니라면 하루씩 process_day 실행
-        for _ in range(days):
+        if self.took_leave:
             print(f"\n===== {self.current_date.strftime('%Y-%m-%d')} =====")
-            self.process_day()
-            if self.took_leave:
-                break
+            print("이미 휴학했습니다.")
+            return
+
+        # 아니라면 하루씩 진행
+        for event in itertools.islice(self.iter_days(), days):
+            print(f"\n===== {event.date.strftime('%Y-%m-%d')} =====")
+            self._report(event)
 
     def status(self) -> None:
         print(f"\n현재 날짜: {self.current_date.strftime('%Y-%m-%d')}")
@@ -0,0 +1,225 @@
+import asyncio
+import heapq
+import itertools
+import random
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from .eviction_policy import EvictionPolicy
+from .refrigerator_stack import FoodEatenException, _FridgeContents
+
+
+class AsyncRefrigeratorStack:
+    """
+    asyncio 용 냉장고 스택 구현:
+    - RefrigeratorStack 과 같은 규칙 (유통기한, 신선도, "누가 이걸 다 먹었어?!")
+    - 스레드와 락 없이 이벤트 루프 한 곳에서만 사용
+    - 유통기한은 가장 가까운 마감 시각에 맞춘 loop.call_at 타이머 하나로 처리
+    - wait_for 로 조건에 맞는 음식이 들어올 때까지 기다릴 수 있음
+    """
+
+    # 벌크 연산 중 이 개수마다 이벤트 루프에 양보
+    _BATCH_SIZE = 64
+
+    def __init__(
+        self,
+        expiry_time: int = 60,
+        max_size: int = 10,
+        eviction_policy: Union[str, EvictionPolicy] = "fifo",
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        냉장고 스택 초기화 (이벤트 루프는 쓸 때마다 지금 돌고 있는 루프를 씀)
+
+        Args:
+            expiry_time: 유통기한 (초 단위, 기본 60초)
+            max_size: 냉장고 최대 크기 (기본 10)
+            eviction_policy: 가득 찼을 때 버릴 음식을 고르는 정책
+                ("fifo", "lru", "lfu", "least_fresh" 또는 EvictionPolicy 객체, 기본 "fifo")
+            rng: 랜덤 예외에 쓸 난수 생성기 (기본은 random 모듈)
+        """
+        self._contents = _FridgeContents(expiry_time, eviction_policy)
+        self._max_size = max_size
+        self._rng = rng if rng is not None else random
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # (마감 시각, 순서, key) 힙, 신선도가 바뀌면 새 항목을 넣고 낡은 항목은 건너뜀
+        self._deadlines: List[Tuple[float, int, int]] = []
+        self._counter = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_when: Optional[float] = None
+        self._waiters: List[Tuple[Callable[[Any], bool], asyncio.Future]] = []
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        지금 돌고 있는 이벤트 루프 반환
+        다른 루프로 옮겨오면 (예: asyncio.run 을 다시 부름) 타이머를 새 루프에 다시 맞춤
+        기본 루프의 loop.time() 은 모두 time.monotonic() 이라 기록된 시각은 그대로 씀
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._disarm()
+            self._waiters = [w for w in self._waiters if not w[1].done()]
+            if self._deadlines:
+                self._arm(self._deadlines[0][0])
+        return loop
+
+    def _schedule(self, key: int) -> None:
+        """아이템의 마감 시각을 등록하고 필요하면 타이머를 앞당김"""
+        deadline = self._contents.deadline(key)
+        heapq.heappush(self._deadlines, (deadline, next(self._counter), key))
+        # 낡은 항목이 너무 쌓이면 힙을 다시 만듦
+        if len(self._deadlines) > 2 * len(self._contents) + 16:
+            self._deadlines = [
+                (self._contents.deadline(k), next(self._counter), k)
+                for k in self._contents.items
+            ]
+            heapq.heapify(self._deadlines)
+        if self._timer_when is None or deadline < self._timer_when:
+            self._arm(deadline)
+
+    def _arm(self, when: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self._get_loop().call_at(when, self._expire)
+        self._timer_when = when
+
+    def _disarm(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._timer_when = None
+
+    def _expire(self) -> None:
+        """마감 시각이 지난 아이템을 제거하고 다음 마감 시각에 타이머를 다시 맞춤"""
+        self._timer = None
+        self._timer_when = None
+        now = self._get_loop().time()
+
+        while self._deadlines:
+            deadline, _, key = self._deadlines[0]
+            if key not in self._contents.items or deadline != self._contents.deadline(key):
+                heapq.heappop(self._deadlines)  # 이미 빠졌거나 낡은 항목
+                continue
+            if deadline > now:
+                self._arm(deadline)
+                return
+            heapq.heappop(self._deadlines)
+            self._remove(key)
+
+    def _remove(self, key: int) -> Any:
+        """아이템을 빼고, 냉장고가 비면 타이머도 정리"""
+        item = self._contents.remove(key)
+        if not self._contents.items:
+            self._deadlines.clear()
+            self._disarm()
+        return item
+
+    def push(self, item: Any) -> None:
+        """
+        냉장고에 아이템 추가
+
+        Args:
+            item: 추가할 아이템
+        """
+        # 냉장고가 가득 찼으면 제거 정책에 따라 하나 버리기
+        if len(self._contents) >= self._max_size:
+            self._contents.evict()
+
+        # 새 아이템 추가
+        self._schedule(self._contents.add(item, self._get_loop().time()))
+
+        # 기다리는 쪽 깨우기
+        if self._waiters:
+            waiters, self._waiters = self._waiters, []
+            for predicate, future in waiters:
+                if future.done():
+                    continue
+                try:
+                    matched = predicate(item)
+                except Exception as e:
+                    future.set_exception(e)
+                    continue
+                if matched:
+                    future.set_result(item)
+                else:
+                    self._waiters.append((predicate, future))
+
+    def pop(self) -> Any:
+        """냉장고에서 가장 최근 아이템 꺼내기"""
+        return self._remove(self._contents.top())
+
+    def peek(self) -> Any:
+        """냉장고의 맨 위 아이템 확인하기 (꺼내지 않음)"""
+        return self._contents.items[self._contents.top()]
+
+    def find(self, item_match) -> Optional[Any]:
+        """
+        냉장고에서 아이템 찾기 (람다 함수로 비교 가능)
+        찾으면 신선도가 감소하고 유통기한이 앞당겨짐
+
+        Args:
+            item_match: 비교할 아이템 또는 비교 함수
+        """
+        if self._rng.random() < 0.01:  # 1% 확률로 예외 발생
+            raise FoodEatenException("누가 이걸 다 먹었어?!")
+
+        key = self._contents.find(item_match)
+        if key is None:
+            return None
+        self._schedule(key)
+        return self._contents.items[key]
+
+    def size(self) -> int:
+        """냉장고 내 아이템 개수 반환"""
+        return len(self._contents)
+
+    def get_freshness(self, item) -> int:
+        """아이템의 현재 신선도 반환 (0-10, 높을수록 신선)"""
+        key = self._contents.key_of(item)
+        if key is None:
+            return 0
+        return self._contents.freshness[key]
+
+    def get_expiry_time(self, item) -> Optional[float]:
+        """아이템의 남은 유통기한 시간 반환 (초 단위)"""
+        key = self._contents.key_of(item)
+        if key is None:
+            return None
+        return max(0, self._contents.deadline(key) - self._get_loop().time())
+
+    async def push_many(self, items: Iterable[Any]) -> None:
+        """여러 아이템을 차례로 추가 (중간중간 이벤트 루프에 양보)"""
+        for i, item in enumerate(items, 1):
+            self.push(item)
+            if i % self._BATCH_SIZE == 0:
+                await asyncio.sleep(0)
+
+    async def pop_many(self, n: int) -> List[Any]:
+        """최근 아이템부터 최대 n개 꺼내기"""
+        items = []
+        while self._contents.items and len(items) < n:
+            items.append(self.pop())
+            if len(items) % self._BATCH_SIZE == 0:
+                await asyncio.sleep(0)
+        return items
+
+    async def wait_for(self, predicate: Callable[[Any], bool]) -> Any:
+        """
+        조건에 맞는 아이템이 들어올 때까지 기다렸다가 반환 (꺼내지 않음)
+        이미 냉장고에 있으면 바로 반환
+
+        Args:
+            predicate: 아이템을 받아 참/거짓을 돌려주는 함수
+        """
+        for item in self._contents.items.values():
+            if predicate(item):
+                return item
+
+        future = self._get_loop().create_future()
+        self._waiters.append((predicate, future))
+        return await future
+
+    def close(self) -> None:
+        """유통기한 타이머 정리"""
+        self._disarm()
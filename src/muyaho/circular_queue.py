@@ -14,6 +14,9 @@ class CircularQueue:
             return True
         return False
 	
+    def size(self):
+        return (self.rear - self.front) % self.MAX_SIZE
+	
     def is_full(self):
         if (self.rear+1)%self.MAX_SIZE == self.front:
             return True
@@ -1,6 +1,6 @@
 import time
 import random
-from typing import Any
+from typing import Any, Optional
 from .circular_queue import CircularQueue
 
 class CaffeinatedTask:
@@ -10,7 +10,14 @@ class CaffeinatedTask:
         self.timestamp = time.time()
 
 class CoffeeQueue:
-    def __init__(self, max_size: int = 100, caffeine_threshold: int = 30):
+    def __init__(
+        self,
+        max_size: int = 100,
+        caffeine_threshold: int = 30,
+        rng: Optional[random.Random] = None,
+    ):
+        # rng: 과제가 튕길지 정하는 난수 생성기 (기본은 random 모듈)
+        self._rng = rng if rng is not None else random
         self.coffee_queue = CircularQueue()
         self.task_queue = CircularQueue()
         self.caffeine_threshold = caffeine_threshold
@@ -42,7 +49,7 @@ class CoffeeQueue:
             task.caffeine_level += self.caffeine_level
 
             if task.caffeine_level >= self.caffeine_threshold:
-                if random.random() < 0.3:
+                if self._rng.random() < 0.3:
                     print(f"💥 과카페인 상태로 튕긴 과제: {task.data}")
                     self.bounced_tasks.append(task.data)
                     continue
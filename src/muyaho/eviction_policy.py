@@ -0,0 +1,181 @@
+import heapq
+import itertools
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+
+class EvictionPolicy(ABC):
+    """
+    냉장고가 가득 찼을 때 무엇을 버릴지 정하는 정책의 기본 클래스
+    - 아이템은 push 할 때마다 받는 고유 번호(key)로 구분 (같은 값이 여러 번 들어와도 따로 관리)
+    - add / touch / remove 로 상태를 갱신하고 evict 로 버릴 아이템을 고름
+    """
+
+    name = ""
+
+    @abstractmethod
+    def add(self, key: int, freshness: int) -> None:
+        """push 로 아이템이 들어왔을 때 호출"""
+
+    @abstractmethod
+    def touch(self, key: int, freshness: int) -> None:
+        """find 로 아이템이 검색되었을 때 호출"""
+
+    @abstractmethod
+    def remove(self, key: int) -> None:
+        """pop 또는 유통기한 만료로 아이템이 빠졌을 때 호출"""
+
+    @abstractmethod
+    def evict(self) -> int:
+        """버릴 아이템의 key 를 정책에서 빼고 반환 (비어있으면 KeyError)"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """정책이 관리 중인 아이템 수"""
+
+
+class FIFOPolicy(EvictionPolicy):
+    """먼저 들어온 음식부터 버림 (O(1))"""
+
+    name = "fifo"
+
+    def __init__(self):
+        self._order: "OrderedDict[int, None]" = OrderedDict()
+
+    def add(self, key: int, freshness: int) -> None:
+        self._order.pop(key, None)
+        self._order[key] = None
+
+    def touch(self, key: int, freshness: int) -> None:
+        pass
+
+    def remove(self, key: int) -> None:
+        self._order.pop(key, None)
+
+    def evict(self) -> int:
+        if not self._order:
+            raise KeyError("버릴 음식이 없어요!")
+        key, _ = self._order.popitem(last=False)
+        return key
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+class LRUPolicy(FIFOPolicy):
+    """가장 오랫동안 안 찾은 음식부터 버림 (O(1))"""
+
+    name = "lru"
+
+    def touch(self, key: int, freshness: int) -> None:
+        if key in self._order:
+            self._order.move_to_end(key)
+
+
+class _HeapPolicy(EvictionPolicy):
+    """
+    (우선순위, 추가 순서) 가 가장 작은 음식부터 버리는 힙 기반 정책 (O(log n))
+    우선순위가 바뀌면 새 항목을 넣고, 낡은 항목은 evict 때 건너뜀
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, int]] = []
+        self._entries: Dict[int, Tuple[int, int]] = {}  # key -> (우선순위, 추가 순서)
+        self._counter = itertools.count()
+
+    @abstractmethod
+    def _priority(self, key: int, freshness: int) -> int:
+        """작을수록 먼저 버려지는 우선순위"""
+
+    def _push(self, key: int, priority: int, order: int) -> None:
+        self._entries[key] = (priority, order)
+        heapq.heappush(self._heap, (priority, order, key))
+        # 낡은 항목이 너무 쌓이면 힙을 다시 만듦
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = [(p, o, i) for i, (p, o) in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def add(self, key: int, freshness: int) -> None:
+        self._push(key, self._priority(key, freshness), next(self._counter))
+
+    def touch(self, key: int, freshness: int) -> None:
+        if key not in self._entries:
+            return
+        _, order = self._entries[key]
+        self._push(key, self._priority(key, freshness), order)
+
+    def remove(self, key: int) -> None:
+        self._entries.pop(key, None)
+
+    def evict(self) -> int:
+        while self._heap:
+            priority, order, key = heapq.heappop(self._heap)
+            if self._entries.get(key) == (priority, order):
+                del self._entries[key]
+                return key
+        raise KeyError("버릴 음식이 없어요!")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LFUPolicy(_HeapPolicy):
+    """가장 적게 찾은 음식부터 버림, 같으면 오래된 것부터 (O(log n))"""
+
+    name = "lfu"
+
+    def __init__(self):
+        super().__init__()
+        self._hits: Dict[int, int] = {}
+
+    def _priority(self, key: int, freshness: int) -> int:
+        return self._hits.get(key, 0)
+
+    def add(self, key: int, freshness: int) -> None:
+        self._hits[key] = 0
+        super().add(key, freshness)
+
+    def touch(self, key: int, freshness: int) -> None:
+        if key in self._hits:
+            self._hits[key] += 1
+        super().touch(key, freshness)
+
+    def remove(self, key: int) -> None:
+        self._hits.pop(key, None)
+        super().remove(key)
+
+    def evict(self) -> int:
+        key = super().evict()
+        self._hits.pop(key, None)
+        return key
+
+
+class LeastFreshPolicy(_HeapPolicy):
+    """신선도가 가장 낮은 음식부터 버림, 같으면 오래된 것부터 (O(log n))"""
+
+    name = "least_fresh"
+
+    def _priority(self, key: int, freshness: int) -> int:
+        return freshness
+
+
+EVICTION_POLICIES = {
+    policy.name: policy
+    for policy in (FIFOPolicy, LRUPolicy, LFUPolicy, LeastFreshPolicy)
+}
+
+
+def make_eviction_policy(name: str) -> EvictionPolicy:
+    """
+    이름으로 제거 정책 만들기
+
+    Args:
+        name: "fifo", "lru", "lfu", "least_fresh" 중 하나
+    """
+    try:
+        return EVICTION_POLICIES[name]()
+    except KeyError:
+        raise ValueError(
+            f"알 수 없는 제거 정책: {name!r} (가능: {', '.join(EVICTION_POLICIES)})"
+        ) from None
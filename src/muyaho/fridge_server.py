@@ -0,0 +1,472 @@
+"""
+공유 냉장고 서버
+
+한 호스트의 여러 프로세스가 유닉스 소켓으로 같은 RefrigeratorStack 을 쓰게 해줌
+
+    python -m muyaho.fridge_server
+
+프레임 형식: 4바이트 빅엔디언 길이 + pickle 본문
+- 요청: [(연산, 냉장고 이름, 인자 튜플), ...]
+- 응답: [(성공 여부, 반환값 또는 예외), ...]
+한 프레임에 여러 요청을 묶어 보낼 수 있음 (파이프라인)
+
+pickle 을 쓰므로 같은 사용자끼리만 통신해야 함
+- 기본 소켓은 $XDG_RUNTIME_DIR 또는 임시 디렉터리 아래 사용자 전용 디렉터리(0700)에 만듦
+- SO_PEERCRED 를 지원하면 서버와 클라이언트 모두 상대 UID 가 자기와 같은지 확인한 뒤에만 pickle 을 읽음
+"""
+
+import argparse
+import errno
+import inspect
+import os
+import pickle
+import queue
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .eviction_policy import EVICTION_POLICIES, EvictionPolicy
+from .refrigerator_stack import RefrigeratorStack
+
+_HEADER = struct.Struct("!I")
+
+_UCRED = struct.Struct("3i")  # pid, uid, gid
+
+# 냉장고 생성 인자 확인용 (요청마다 다시 만들지 않도록 한 번만)
+_FRIDGE_SIGNATURE = inspect.signature(RefrigeratorStack)
+
+# 클라이언트가 부를 수 있는 연산
+OPERATIONS = ("open", "push", "pop", "peek", "find", "size", "get_freshness")
+
+
+def default_socket_path() -> str:
+    """
+    기본 소켓 경로
+    $XDG_RUNTIME_DIR/muyaho-fridge.sock, 없으면 임시 디렉터리의 muyaho-<uid>/fridge.sock
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "muyaho-fridge.sock")
+    return os.path.join(tempfile.gettempdir(), f"muyaho-{os.getuid()}", "fridge.sock")
+
+
+def _ensure_private_dir(directory: str) -> None:
+    """디렉터리를 0700 으로 만들고, 다른 사용자가 건드릴 수 없는지 확인"""
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    st = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(st.st_mode)
+        or st.st_uid != os.getuid()
+        or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    ):
+        raise PermissionError(f"다른 사용자도 쓸 수 있는 디렉터리예요: {directory}")
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """소켓 상대편의 UID (SO_PEERCRED 를 지원하지 않으면 None)"""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    _, uid, _ = _UCRED.unpack(
+        sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _UCRED.size)
+    )
+    return uid
+
+
+def _is_same_user(sock: socket.socket) -> bool:
+    uid = _peer_uid(sock)
+    return uid is None or uid == os.getuid()
+
+
+def _remove_stale_socket(path: str) -> None:
+    """아무도 듣고 있지 않은 소켓 파일만 지움"""
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode):
+        raise FileExistsError(errno.EEXIST, "소켓이 아닌 파일이 이미 있어요", path)
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(errno.EADDRINUSE, "이미 다른 서버가 쓰고 있어요", path)
+
+
+def _recv_exact(sock: socket.socket, n: int) -> Optional[bytes]:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            return None
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def send_frame(sock: socket.socket, obj: Any) -> None:
+    """객체를 길이 접두사 프레임 하나로 보냄"""
+    payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def recv_frame(sock: socket.socket) -> Any:
+    """프레임 하나를 읽어 객체로 반환 (연결이 끊기면 EOFError)"""
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        raise EOFError("연결이 끊겼어요!")
+    (length,) = _HEADER.unpack(header)
+    payload = _recv_exact(sock, length)
+    if payload is None:
+        raise EOFError("연결이 끊겼어요!")
+    return pickle.loads(payload)
+
+
+class FridgeServer(socketserver.ThreadingUnixStreamServer):
+    """이름 붙은 냉장고들을 보관하는 유닉스 소켓 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Optional[str] = None, **fridge_defaults):
+        """
+        Args:
+            socket_path: 유닉스 소켓 경로 (기본은 default_socket_path(),
+                남아 있는 소켓 파일은 듣는 서버가 없을 때만 지우고 새로 만듦)
+            fridge_defaults: 새 냉장고를 만들 때 쓸 RefrigeratorStack 인자
+                (eviction_policy 는 이름으로만, 냉장고마다 정책 객체를 따로 만듦)
+        """
+        self.fridge_defaults = fridge_defaults
+        self._effective_config({})  # 잘못된 기본 인자는 첫 요청이 아니라 지금 알려줌
+
+        if socket_path is None:
+            socket_path = default_socket_path()
+            _ensure_private_dir(os.path.dirname(socket_path))
+        _remove_stale_socket(socket_path)
+        self.socket_path = socket_path
+        self.fridges: Dict[str, RefrigeratorStack] = {}
+        self._fridge_configs: Dict[str, Dict[str, Any]] = {}  # 냉장고별 실제 생성 인자
+        self._fridges_lock = threading.Lock()
+        super().__init__(socket_path, _FridgeRequestHandler)
+        os.chmod(socket_path, 0o600)
+
+    def _effective_config(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """기본값까지 채운 RefrigeratorStack 생성 인자 (모르는 인자면 TypeError)"""
+        bound = _FRIDGE_SIGNATURE.bind(
+            **{**self.fridge_defaults, **options}
+        )
+        bound.apply_defaults()
+        config = dict(bound.arguments)
+        if isinstance(config["eviction_policy"], EvictionPolicy):
+            # 정책 객체를 여러 냉장고가 같이 쓰면 서로의 상태를 망가뜨림
+            raise TypeError("eviction_policy 는 이름으로 주세요 (예: \"lru\")")
+        if config["eviction_policy"] not in EVICTION_POLICIES:
+            raise ValueError(f"알 수 없는 제거 정책: {config['eviction_policy']!r}")
+        return config
+
+    def get_fridge(self, name: str, **options) -> RefrigeratorStack:
+        """
+        이름으로 냉장고 가져오기 (없으면 options 로 만듦)
+        이미 있는 냉장고와 options 가 다르면 ValueError
+        """
+        # 대부분의 요청: 이미 있는 냉장고를 옵션 없이 씀 (락, 인자 확인 없이 바로)
+        fridge = self.fridges.get(name)
+        if fridge is not None and not options:
+            return fridge
+
+        with self._fridges_lock:
+            config = self._effective_config(options)
+            fridge = self.fridges.get(name)
+            if fridge is None:
+                fridge = RefrigeratorStack(**config)
+                self.fridges[name] = fridge
+                self._fridge_configs[name] = config
+                return fridge
+
+            existing = self._fridge_configs[name]
+            conflicts = [
+                f"{key}={existing[key]!r} (요청: {config[key]!r})"
+                for key in options
+                if existing[key] != config[key]
+            ]
+            if conflicts:
+                raise ValueError(
+                    f"냉장고 {name!r} 는 이미 다른 설정으로 있어요: {', '.join(conflicts)}"
+                )
+            return fridge
+
+    def execute(self, op: str, name: str, args: Tuple) -> Any:
+        if op not in OPERATIONS:
+            raise ValueError(f"알 수 없는 연산: {op!r}")
+        if op == "open":
+            (options,) = args
+            self.get_fridge(name, **options)
+            return None
+        return getattr(self.get_fridge(name), op)(*args)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class _FridgeRequestHandler(socketserver.BaseRequestHandler):
+    server: FridgeServer
+
+    def handle(self) -> None:
+        # 다른 사용자가 보낸 pickle 은 읽지 않음
+        if not _is_same_user(self.request):
+            return
+
+        while True:
+            try:
+                requests = recv_frame(self.request)
+            except (EOFError, ConnectionError):
+                return
+
+            responses = []
+            for op, name, args in requests:
+                try:
+                    responses.append((True, self.server.execute(op, name, args)))
+                except Exception as e:
+                    responses.append((False, e))
+            send_frame(self.request, responses)
+
+
+class FridgePipeline:
+    """
+    여러 요청을 모았다가 한 번에 보내는 파이프라인
+
+        with client.pipeline() as pipe:
+            pipe.push("우유")
+            pipe.size()
+        pipe.results  # [None, 1]
+    """
+
+    def __init__(self, client: "RefrigeratorClient"):
+        self._client = client
+        self._requests: List[Tuple[str, str, Tuple]] = []
+        self.results: List[Any] = []
+
+    def _add(self, op: str, *args) -> "FridgePipeline":
+        self._requests.append((op, self._client.name, args))
+        return self
+
+    def push(self, item: Any) -> "FridgePipeline":
+        return self._add("push", item)
+
+    def pop(self) -> "FridgePipeline":
+        return self._add("pop")
+
+    def peek(self) -> "FridgePipeline":
+        return self._add("peek")
+
+    def find(self, item_match) -> "FridgePipeline":
+        return self._add("find", self._client._check_match(item_match))
+
+    def size(self) -> "FridgePipeline":
+        return self._add("size")
+
+    def get_freshness(self, item) -> "FridgePipeline":
+        return self._add("get_freshness", item)
+
+    def execute(self) -> List[Any]:
+        """
+        모은 요청을 보내고 결과 목록을 반환
+        실패한 요청이 있으면 첫 번째 예외를 다시 발생시킴 (나머지 요청은 이미 실행됨)
+        """
+        requests, self._requests = self._requests, []
+        if not requests:
+            return []
+        responses = self._client._roundtrip(requests)
+        self.results = [value for _, value in responses]
+        for ok, value in responses:
+            if not ok:
+                raise value
+        return self.results
+
+    def __enter__(self) -> "FridgePipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.execute()
+
+
+class RefrigeratorClient:
+    """
+    공유 냉장고 서버의 클라이언트 (RefrigeratorStack 과 같은 API)
+    - 연결은 풀에 보관해서 재사용 (fork 뒤에는 자식이 자기 연결을 새로 만듦)
+    - find 는 값 비교만 가능 (람다는 소켓으로 보낼 수 없음)
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        name: str = "default",
+        pool_size: int = 4,
+        **fridge_options,
+    ):
+        """
+        Args:
+            socket_path: 서버의 유닉스 소켓 경로 (기본은 default_socket_path())
+            name: 사용할 냉장고 이름
+            pool_size: 보관할 최대 연결 수
+            fridge_options: 냉장고가 아직 없을 때 만들 RefrigeratorStack 인자
+                (이미 있는 냉장고와 다르면 ValueError)
+        """
+        self.socket_path = socket_path if socket_path is not None else default_socket_path()
+        self.name = name
+        self._pool_size = pool_size
+        self._pool: "queue.LifoQueue[socket.socket]" = queue.LifoQueue(pool_size)
+        self._pid = os.getpid()
+        if fridge_options:
+            self._call("open", fridge_options)
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+            # 다른 사용자가 띄운 서버의 pickle 은 읽지 않음
+            if not _is_same_user(sock):
+                raise PermissionError(f"다른 사용자의 서버예요: {self.socket_path}")
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def _check_fork(self) -> None:
+        """fork 된 자식 프로세스면 부모에게 물려받은 연결을 버리고 새 풀을 씀"""
+        if os.getpid() == self._pid:
+            return
+        inherited, self._pool = self._pool, queue.LifoQueue(self._pool_size)
+        self._pid = os.getpid()
+        # 자식 쪽 fd 만 닫힘 (부모의 연결은 그대로)
+        while True:
+            try:
+                inherited.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _roundtrip(self, requests: List[Tuple[str, str, Tuple]]) -> List[Tuple[bool, Any]]:
+        self._check_fork()
+        try:
+            sock = self._pool.get_nowait()
+        except queue.Empty:
+            sock = self._connect()
+        else:
+            try:
+                send_frame(sock, requests)
+            except OSError:
+                # 서버가 재시작되면 풀의 연결은 죽어 있음
+                # 요청이 서버에 닿지 않았으니 새 연결로 한 번만 다시 보냄
+                sock.close()
+                sock = self._connect()
+            else:
+                return self._finish_roundtrip(sock)
+
+        try:
+            send_frame(sock, requests)
+        except BaseException:
+            sock.close()
+            raise
+        return self._finish_roundtrip(sock)
+
+    def _finish_roundtrip(self, sock: socket.socket) -> List[Tuple[bool, Any]]:
+        """응답을 받고 연결을 풀에 돌려놓음"""
+        try:
+            responses = recv_frame(sock)
+        except BaseException:
+            sock.close()
+            raise
+        try:
+            self._pool.put_nowait(sock)
+        except queue.Full:
+            sock.close()
+        return responses
+
+    def _call(self, op: str, *args) -> Any:
+        ((ok, value),) = self._roundtrip([(op, self.name, args)])
+        if not ok:
+            raise value
+        return value
+
+    @staticmethod
+    def _check_match(item_match):
+        if callable(item_match):
+            raise TypeError("공유 냉장고에서는 함수로 찾을 수 없어요! 값으로 찾아주세요.")
+        return item_match
+
+    def push(self, item: Any) -> None:
+        self._call("push", item)
+
+    def pop(self) -> Any:
+        return self._call("pop")
+
+    def peek(self) -> Any:
+        return self._call("peek")
+
+    def find(self, item_match) -> Optional[Any]:
+        return self._call("find", self._check_match(item_match))
+
+    def size(self) -> int:
+        return self._call("size")
+
+    def get_freshness(self, item) -> int:
+        return self._call("get_freshness", item)
+
+    def pipeline(self) -> FridgePipeline:
+        """여러 요청을 한 번의 왕복으로 보내는 파이프라인 만들기"""
+        return FridgePipeline(self)
+
+    def close(self) -> None:
+        """풀에 있는 연결을 모두 닫음"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def __enter__(self) -> "RefrigeratorClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="muyaho 공유 냉장고 서버")
+    parser.add_argument(
+        "--socket", default=None, help="유닉스 소켓 경로 (기본: 사용자 전용 디렉터리)"
+    )
+    parser.add_argument("--expiry-time", type=int, default=60, help="유통기한 (초)")
+    parser.add_argument("--max-size", type=int, default=10, help="냉장고 최대 크기")
+    parser.add_argument(
+        "--eviction-policy",
+        default="fifo",
+        choices=tuple(EVICTION_POLICIES),
+        help="가득 찼을 때 버릴 음식을 고르는 정책",
+    )
+    args = parser.parse_args(argv)
+
+    with FridgeServer(
+        args.socket,
+        expiry_time=args.expiry_time,
+        max_size=args.max_size,
+        eviction_policy=args.eviction_policy,
+    ) as server:
+        print(f"🧊 공유 냉장고 서버 시작: {server.socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
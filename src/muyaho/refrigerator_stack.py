@@ -1,8 +1,12 @@
+import itertools
 import random
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Union
 import threading
 
+from .eviction_policy import EvictionPolicy, make_eviction_policy
+
 
 class FoodExpiredException(Exception):
     """유통기한이 지난 음식 예외"""
@@ -16,6 +20,99 @@ class FoodEatenException(Exception):
     pass
 
 
+class _FridgeContents:
+    """
+    냉장고 안의 음식과 메타데이터 (RefrigeratorStack, AsyncRefrigeratorStack 공용)
+    - push 마다 고유 번호(key)를 붙여서 같은 값이 여러 번 들어와도 따로 관리
+    - 쌓인 순서는 OrderedDict 로 유지해서 pop / 버리기 / 만료 제거가 모두 O(1)
+    """
+
+    def __init__(
+        self, expiry_time: float, eviction_policy: Union[str, EvictionPolicy]
+    ):
+        self.items: "OrderedDict[int, Any]" = OrderedDict()  # key -> 아이템 (아래부터 위)
+        self.timestamps: Dict[int, float] = {}  # 각 요소의 추가된 시간
+        self.freshness: Dict[int, int] = {}  # 각 요소의 신선도 (낮을수록 신선하지 않음)
+        self.expiry_time = expiry_time
+        if isinstance(eviction_policy, str):
+            eviction_policy = make_eviction_policy(eviction_policy)
+        self.eviction_policy = eviction_policy
+        self._keys = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, item: Any, now: float) -> int:
+        """아이템을 맨 위에 올리고 key 반환"""
+        key = next(self._keys)
+        self.items[key] = item
+        self.timestamps[key] = now
+        self.freshness[key] = 10  # 초기 신선도 10 (최대)
+        self.eviction_policy.add(key, 10)
+        return key
+
+    def remove(self, key: int) -> Any:
+        """아이템을 빼고 메타데이터 정리"""
+        item = self.items.pop(key)
+        self.timestamps.pop(key, None)
+        self.freshness.pop(key, None)
+        self.eviction_policy.remove(key)
+        return item
+
+    def evict(self) -> int:
+        """제거 정책이 고른 아이템을 버리고 key 반환"""
+        try:
+            key = self.eviction_policy.evict()
+        except KeyError:
+            key = None
+        if key not in self.items:
+            key = next(iter(self.items))  # 정책이 모르는 아이템뿐이면 가장 오래된 것
+        self.remove(key)
+        return key
+
+    def top(self) -> int:
+        """맨 위 아이템의 key"""
+        if not self.items:
+            raise IndexError("냉장고가 비어있어요!")
+        return next(reversed(self.items))
+
+    def find(self, item_match) -> Optional[int]:
+        """
+        아이템을 찾아 신선도를 낮추고 key 반환 (없으면 None)
+
+        Args:
+            item_match: 비교할 아이템 또는 비교 함수
+        """
+        for key, item in self.items.items():
+            if callable(item_match):
+                matched = item_match(item)
+            else:
+                matched = item == item_match
+            if matched:
+                # 신선도 감소
+                freshness = max(0, self.freshness[key] - 1)
+                self.freshness[key] = freshness
+                self.eviction_policy.touch(key, freshness)
+                return key
+        return None
+
+    def key_of(self, item: Any) -> Optional[int]:
+        """같은 값을 가진 가장 아래 아이템의 key (신선도는 그대로)"""
+        for key, fridge_item in self.items.items():
+            if fridge_item == item:
+                return key
+        return None
+
+    def deadline(self, key: int) -> float:
+        """아이템이 상하는 시각"""
+        # 신선도가 낮을수록 유통기한이 빨리 지남
+        return self.timestamps[key] + self.expiry_time * (self.freshness[key] / 10)
+
+    def expired(self, now: float) -> List[int]:
+        """now 기준으로 유통기한이 지난 아이템의 key 목록"""
+        return [key for key in self.items if now > self.deadline(key)]
+
+
 class RefrigeratorStack:
     """
     냉장고 스택 구현:
@@ -25,26 +122,41 @@ class RefrigeratorStack:
     - 랜덤 접근 시도 시 10% 확률로 "누가 이걸 다 먹었어?!" 예외 발생
     """
 
-    def __init__(self, expiry_time: int = 60, max_size: int = 10):
+    def __init__(
+        self,
+        expiry_time: int = 60,
+        max_size: int = 10,
+        eviction_policy: Union[str, EvictionPolicy] = "fifo",
+        rng: Optional[random.Random] = None,
+        clock: Optional[Callable[[], float]] = None,
+        background_expiry: bool = True,
+    ):
         """
         냉장고 스택 초기화
 
         Args:
             expiry_time: 유통기한 (초 단위, 기본 60초)
             max_size: 냉장고 최대 크기 (기본 10)
+            eviction_policy: 가득 찼을 때 버릴 음식을 고르는 정책
+                ("fifo", "lru", "lfu", "least_fresh" 또는 EvictionPolicy 객체, 기본 "fifo")
+            rng: 랜덤 예외에 쓸 난수 생성기 (기본은 random 모듈)
+            clock: 현재 시각을 돌려주는 함수 (기본 time.time)
+            background_expiry: False 면 유통기한 체크 스레드를 띄우지 않음
+                (remove_expired 를 직접 불러야 함)
         """
-        self._stack: List[Any] = []
-        self._timestamps: Dict[int, float] = {}  # 각 요소의 추가된 시간
-        self._freshness: Dict[
-            int, int
-        ] = {}  # 각 요소의 신선도 (낮을수록 신선하지 않음)
-        self._expiry_time = expiry_time
+        self._contents = _FridgeContents(expiry_time, eviction_policy)
         self._max_size = max_size
+        self._rng = rng if rng is not None else random
+        self._clock = clock if clock is not None else time.time
         self._lock = threading.Lock()
 
         # 유통기한 체크 스레드 시작
-        self._cleanup_thread = threading.Thread(target=self._check_expiry, daemon=True)
-        self._cleanup_thread.start()
+        self._cleanup_thread: Optional[threading.Thread] = None
+        if background_expiry:
+            self._cleanup_thread = threading.Thread(
+                target=self._check_expiry, daemon=True
+            )
+            self._cleanup_thread.start()
 
     def push(self, item: Any) -> None:
         """
@@ -54,44 +166,22 @@ class RefrigeratorStack:
             item: 추가할 아이템
         """
         with self._lock:
-            # 냉장고가 가득 찼으면 가장 오래된 항목 제거
-            if len(self._stack) >= self._max_size:
-                oldest = self._stack.pop(0)
-                item_id = id(oldest)
-                if item_id in self._timestamps:
-                    del self._timestamps[item_id]
-                if item_id in self._freshness:
-                    del self._freshness[item_id]
+            # 냉장고가 가득 찼으면 제거 정책에 따라 하나 버리기
+            if len(self._contents) >= self._max_size:
+                self._contents.evict()
 
             # 새 아이템 추가
-            self._stack.append(item)
-            self._timestamps[id(item)] = time.time()
-            self._freshness[id(item)] = 10  # 초기 신선도 10 (최대)
+            self._contents.add(item, self._clock())
 
     def pop(self) -> Any:
         """냉장고에서 가장 최근 아이템 꺼내기"""
         with self._lock:
-            if not self._stack:
-                raise IndexError("냉장고가 비어있어요!")
-
-            item = self._stack.pop()
-            item_id = id(item)
-
-            # 메타데이터 정리
-            if item_id in self._timestamps:
-                del self._timestamps[item_id]
-            if item_id in self._freshness:
-                del self._freshness[item_id]
-
-            return item
+            return self._contents.remove(self._contents.top())
 
     def peek(self) -> Any:
         """냉장고의 맨 위 아이템 확인하기 (꺼내지 않음)"""
         with self._lock:
-            if not self._stack:
-                raise IndexError("냉장고가 비어있어요!")
-
-            return self._stack[-1]
+            return self._contents.items[self._contents.top()]
 
     def find(self, item_match) -> Optional[Any]:
         """
@@ -102,79 +192,43 @@ class RefrigeratorStack:
             item_match: 비교할 아이템 또는 비교 함수
         """
         with self._lock:
-            if random.random() < 0.01:  # 1% 확률로 예외 발생
+            if self._rng.random() < 0.01:  # 1% 확률로 예외 발생
                 raise FoodEatenException("누가 이걸 다 먹었어?!")
 
-            for item in self._stack:
-                if callable(item_match):
-                    if item_match(item):
-                        # 신선도 감소
-                        self._freshness[id(item)] = max(
-                            0, self._freshness.get(id(item), 10) - 1
-                        )
-                        return item
-                elif item == item_match:
-                    # 신선도 감소
-                    self._freshness[id(item)] = max(
-                        0, self._freshness.get(id(item), 10) - 1
-                    )
-                    return item
-
-            return None
+            key = self._contents.find(item_match)
+            if key is None:
+                return None
+            return self._contents.items[key]
 
     def size(self) -> int:
         """냉장고 내 아이템 개수 반환"""
         with self._lock:
-            return len(self._stack)
+            return len(self._contents)
 
     def _check_expiry(self) -> None:
         """유통기한이 지난 아이템을 주기적으로 제거하는 백그라운드 메서드"""
         while True:
             time.sleep(1)  # 1초마다 체크
+            self.remove_expired()
 
-            with self._lock:
-                current_time = time.time()
-                expired_indices = []
-
-                # 유통기한이 지난 아이템 찾기
-                for i, item in enumerate(self._stack):
-                    item_id = id(item)
-                    if item_id in self._timestamps:
-                        item_age = current_time - self._timestamps[item_id]
-                        freshness = self._freshness.get(item_id, 10)
-
-                        # 신선도가 낮을수록 유통기한이 빨리 지남
-                        adjusted_expiry = self._expiry_time * (freshness / 10)
-
-                        if item_age > adjusted_expiry:
-                            expired_indices.append(i)
-
-                # 뒤에서부터 제거 (인덱스 변화 방지)
-                for i in sorted(expired_indices, reverse=True):
-                    item = self._stack.pop(i)
-                    item_id = id(item)
-                    if item_id in self._timestamps:
-                        del self._timestamps[item_id]
-                    if item_id in self._freshness:
-                        del self._freshness[item_id]
+    def remove_expired(self) -> None:
+        """유통기한이 지난 아이템을 지금 바로 제거"""
+        with self._lock:
+            for key in self._contents.expired(self._clock()):
+                self._contents.remove(key)
 
     def get_freshness(self, item) -> int:
         """아이템의 현재 신선도 반환 (0-10, 높을수록 신선)"""
         with self._lock:
-            for fridge_item in self._stack:
-                if fridge_item == item:
-                    return self._freshness.get(id(fridge_item), 0)
-            return 0
+            key = self._contents.key_of(item)
+            if key is None:
+                return 0
+            return self._contents.freshness[key]
 
     def get_expiry_time(self, item) -> Optional[float]:
         """아이템의 남은 유통기한 시간 반환 (초 단위)"""
         with self._lock:
-            for fridge_item in self._stack:
-                if fridge_item == item:
-                    item_id = id(fridge_item)
-                    if item_id in self._timestamps:
-                        freshness = self._freshness.get(item_id, 10)
-                        adjusted_expiry = self._expiry_time * (freshness / 10)
-                        elapsed = time.time() - self._timestamps[item_id]
-                        return max(0, adjusted_expiry - elapsed)
-            return None
+            key = self._contents.key_of(item)
+            if key is None:
+                return None
+            return max(0, self._contents.deadline(key) - self._clock())
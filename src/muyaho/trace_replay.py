@@ -0,0 +1,411 @@
+"""
+연산 기록과 재생
+
+실제 트래픽을 기록해 두었다가 다른 설정으로 다시 돌려보는 도구
+(CoffeeQueue 임계치, RefrigeratorStack max_size / expiry_time 정하기 등)
+
+    recorder = TraceRecorder("fridge.trace")
+    fridge = recorder.track("fridge", "RefrigeratorStack", max_size=10)
+    fridge.push("우유")  # 평소처럼 쓰면 모두 기록됨
+    recorder.close()
+
+    report = TraceReplayer("fridge.trace").run(overrides={"fridge": {"max_size": 20}})
+    print(report.throughput, len(report.diffs))
+
+기록 파일: 레코드마다 4바이트 빅엔디언 길이 + pickle 본문, 이어 붙이기만 함
+- ("new", 시각, 이름, 종류, 설정)
+- ("op", 시각, 이름, 연산, 인자, 난수 목록, 결과, 상태)
+인자를 pickle 할 수 없으면 (예: 람다로 find) 인자를 None 으로 기록하고 재생 때 건너뜀
+"""
+
+import contextlib
+import os
+import pickle
+import random
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .coffee_queue import CoffeeQueue
+from .eviction_policy import EVICTION_POLICIES
+from .refrigerator_stack import RefrigeratorStack
+
+_HEADER = struct.Struct("!I")
+
+# 기록할 수 있는 자료구조와 공개 연산
+TRACKABLE: Dict[str, Tuple[Callable[..., Any], Tuple[str, ...]]] = {
+    "RefrigeratorStack": (
+        RefrigeratorStack,
+        ("push", "pop", "peek", "find", "size", "get_freshness", "get_expiry_time"),
+    ),
+    "CoffeeQueue": (CoffeeQueue, ("enqueue_coffee", "enqueue_task", "process_tasks")),
+}
+
+
+def _state(target: Any) -> Any:
+    """연산 직후 결과 비교에 쓸 상태 요약"""
+    if isinstance(target, CoffeeQueue):
+        return (
+            target.caffeine_level,
+            len(target.completed_tasks),
+            len(target.bounced_tasks),
+        )
+    return target.size()
+
+
+def _dumps(record: Tuple) -> bytes:
+    payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+    return _HEADER.pack(len(payload)) + payload
+
+
+def read_trace(path: str) -> Iterator[Tuple]:
+    """기록 파일의 레코드를 차례로 읽기 (끝이 잘린 레코드는 무시)"""
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            (length,) = _HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            yield pickle.loads(payload)
+
+
+class _RecordingRandom:
+    """뽑은 난수를 모아두는 난수 생성기"""
+
+    def __init__(self, source: Any):
+        self._source = source
+        self.draws: List[float] = []
+
+    def random(self) -> float:
+        value = self._source.random()
+        self.draws.append(value)
+        return value
+
+
+class _ReplayRandom:
+    """기록된 난수를 차례로 돌려주고, 모자라면 시드 고정 난수로 채움"""
+
+    def __init__(self, fallback: random.Random):
+        self._fallback = fallback
+        self.draws: List[float] = []
+        self._index = 0
+
+    def load(self, draws: List[float]) -> None:
+        self.draws = draws
+        self._index = 0
+
+    def random(self) -> float:
+        if self._index < len(self.draws):
+            value = self.draws[self._index]
+            self._index += 1
+            return value
+        return self._fallback.random()
+
+
+class _FrozenClock:
+    """연산 하나를 실행하는 동안에는 같은 시각을 돌려주는 시계"""
+
+    def __init__(self, source: Callable[[], float]):
+        self._source = source
+        self.frozen: Optional[float] = None
+
+    def __call__(self) -> float:
+        return self.frozen if self.frozen is not None else self._source()
+
+
+class _RecordingProxy:
+    """공개 연산을 가로채서 기록하는 프록시"""
+
+    def __init__(
+        self,
+        recorder: "TraceRecorder",
+        name: str,
+        target: Any,
+        rng: _RecordingRandom,
+        ops: Tuple[str, ...],
+        clock: Optional[_FrozenClock] = None,
+    ):
+        self._recorder = recorder
+        self._name = name
+        self._target = target
+        self._rng = rng
+        self._ops = ops
+        self._clock = clock
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._target, attr)
+        if attr not in self._ops:
+            return value
+
+        def recorded(*args):
+            return self._recorder._call(self, attr, value, args)
+
+        return recorded
+
+
+class TraceRecorder:
+    """자료구조의 공개 연산을 시각, 난수와 함께 파일에 기록"""
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            path: 기록 파일 경로 (있으면 뒤에 이어 씀)
+            clock: 시각 함수 (기본 time.time)
+        """
+        self.path = path
+        self._clock = clock
+        self._file: BinaryIO = open(path, "ab")
+        self._lock = threading.Lock()
+
+    def track(self, name: str, kind: str, **config) -> Any:
+        """
+        기록되는 자료구조 만들기
+
+        Args:
+            name: 기록에 쓸 이름
+            kind: "RefrigeratorStack" 또는 "CoffeeQueue"
+            config: 자료구조 생성 인자
+                (냉장고는 재생과 똑같이 움직이도록 기록기의 시계를 쓰고,
+                유통기한은 체크 스레드 대신 연산 직전마다 확인함)
+        """
+        self._check_open()
+        if kind not in TRACKABLE:
+            raise ValueError(f"기록할 수 없는 자료구조: {kind!r}")
+        factory, ops = TRACKABLE[kind]
+        rng = _RecordingRandom(config.pop("rng", None) or random)
+        clock = None
+        if kind == "RefrigeratorStack":
+            config.pop("clock", None)
+            config.pop("background_expiry", None)
+            clock = _FrozenClock(self._clock)
+            target = factory(rng=rng, clock=clock, background_expiry=False, **config)
+        else:
+            target = factory(rng=rng, **config)
+        self._write(("new", self._clock(), name, kind, config))
+        return _RecordingProxy(self, name, target, rng, ops, clock)
+
+    def _call(
+        self, proxy: _RecordingProxy, op: str, method: Callable, args: Tuple
+    ) -> Any:
+        # 난수가 연산별로 섞이지 않도록 한 번에 하나씩 실행
+        with self._lock:
+            # 닫힌 뒤에는 연산을 실행하지 않음 (기록 없이 상태만 바뀌는 일이 없도록)
+            self._check_open()
+            proxy._rng.draws = []
+            t = self._clock()
+            if proxy._clock is not None:
+                # 재생과 같게: 연산 동안 시각을 t 로 고정하고, 연산 직전에 유통기한 확인
+                proxy._clock.frozen = t
+                proxy._target.remove_expired()
+            try:
+                value = method(*args)
+            except Exception as e:
+                result = ("error", type(e).__name__)
+                raise
+            else:
+                result = ("ok", value)
+            finally:
+                draws, state = proxy._rng.draws, _state(proxy._target)
+                try:
+                    data = _dumps(("op", t, proxy._name, op, args, draws, result, state))
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    # 재생할 수 없는 연산: 인자 없이 자리만 남김
+                    data = _dumps(("op", t, proxy._name, op, None, draws, None, state))
+                self._file.write(data)
+                self._file.flush()
+                if proxy._clock is not None:
+                    proxy._clock.frozen = None
+            return value
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def _check_open(self) -> None:
+        if self._file.closed:
+            raise ValueError(f"기록기가 이미 닫혔어요: {self.path}")
+
+    def _write(self, record: Tuple) -> None:
+        with self._lock:
+            self._file.write(_dumps(record))
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "TraceRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+@dataclass
+class OutcomeDiff:
+    """기록과 재생 결과가 다른 연산"""
+
+    index: int  # 기록 파일에서 몇 번째 연산인지
+    name: str
+    op: str
+    recorded: Any  # (결과, 상태)
+    replayed: Any
+
+
+@dataclass
+class ReplayReport:
+    """재생 결과"""
+
+    operations: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0  # 재생에 걸린 실제 시간 (초)
+    trace_duration: float = 0.0  # 기록된 시간 범위 (초)
+    diffs: List[OutcomeDiff] = field(default_factory=list)
+    hits: int = 0  # 냉장고 find 로 음식을 찾은 횟수
+    misses: int = 0  # 냉장고 find 로 음식을 못 찾은 횟수 (예외 제외)
+    op_time: Dict[str, float] = field(default_factory=dict)  # 연산별 누적 실행 시간 (초)
+    op_count: Dict[str, int] = field(default_factory=dict)  # 연산별 실행 횟수
+
+    @property
+    def throughput(self) -> float:
+        """초당 연산 수"""
+        return self.operations / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """find 적중률 (0-1)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def mean_op_time(self, op: str) -> float:
+        """연산 한 번의 평균 실행 시간 (초)"""
+        count = self.op_count.get(op, 0)
+        return self.op_time.get(op, 0.0) / count if count else 0.0
+
+
+class TraceReplayer:
+    """기록 파일을 원하는 설정으로 다시 실행"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def run(
+        self,
+        speed: Optional[float] = None,
+        overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+        seed: int = 0,
+        quiet: bool = True,
+    ) -> ReplayReport:
+        """
+        기록을 재생하고 결과 보고서 반환
+
+        Args:
+            speed: N(> 0) 이면 기록보다 N배 빠르게, None 이면 최대한 빠르게
+            overrides: 이름별로 바꿀 생성 인자 (예: {"fridge": {"max_size": 20}})
+            seed: 기록보다 난수가 더 필요할 때 쓸 시드
+            quiet: 자료구조가 출력하는 메시지 숨기기
+        """
+        if speed is not None and not speed > 0:
+            raise ValueError(f"speed 는 0보다 커야 해요: {speed!r}")
+        overrides = overrides or {}
+        report = ReplayReport()
+        targets: Dict[str, Any] = {}
+        rng = _ReplayRandom(random.Random(seed))
+        now = 0.0  # 재생 중인 기록 시각 (냉장고의 시계)
+        base: Optional[float] = None
+
+        stdout = open(os.devnull, "w") if quiet else None
+        with contextlib.ExitStack() as stack:
+            if stdout is not None:
+                stack.enter_context(stdout)
+                stack.enter_context(contextlib.redirect_stdout(stdout))
+            started = time.perf_counter()
+
+            for index, record in enumerate(read_trace(self.path)):
+                kind, t = record[0], record[1]
+                if base is None:
+                    base = t
+                now = t
+                if speed is not None:
+                    delay = (t - base) / speed - (time.perf_counter() - started)
+                    if delay > 0:
+                        time.sleep(delay)
+
+                if kind == "new":
+                    _, _, name, target_kind, config = record
+                    factory, _ = TRACKABLE[target_kind]
+                    config = {**config, **overrides.get(name, {})}
+                    if target_kind == "RefrigeratorStack":
+                        config.update(clock=lambda: now, background_expiry=False)
+                    targets[name] = factory(rng=rng, **config)
+                    continue
+
+                _, _, name, op, args, draws, recorded, recorded_state = record
+                target = targets[name]
+                if args is None:
+                    report.skipped += 1
+                    continue
+
+                if isinstance(target, RefrigeratorStack):
+                    target.remove_expired()
+                rng.load(draws)
+                op_started = time.perf_counter()
+                try:
+                    result = ("ok", getattr(target, op)(*args))
+                except Exception as e:
+                    result = ("error", type(e).__name__)
+                op_elapsed = time.perf_counter() - op_started
+                report.operations += 1
+                report.op_time[op] = report.op_time.get(op, 0.0) + op_elapsed
+                report.op_count[op] = report.op_count.get(op, 0) + 1
+                if isinstance(target, RefrigeratorStack) and op == "find":
+                    if result == ("ok", None):
+                        report.misses += 1
+                    elif result[0] == "ok":
+                        report.hits += 1
+
+                replayed = (result, _state(target))
+                if replayed != (recorded, recorded_state):
+                    report.diffs.append(
+                        OutcomeDiff(index, name, op, (recorded, recorded_state), replayed)
+                    )
+
+            report.elapsed = time.perf_counter() - started
+        if base is not None:
+            report.trace_duration = now - base
+        return report
+
+
+def compare_eviction_policies(
+    path: str, name: str, policies: Iterable[str] = tuple(EVICTION_POLICIES)
+) -> Dict[str, ReplayReport]:
+    """
+    기록 하나를 제거 정책별로 재생해서 적중률과 연산 비용 비교
+
+        for policy, report in compare_eviction_policies("fridge.trace", "fridge").items():
+            print(policy, report.hit_rate, report.mean_op_time("push"))
+
+    Args:
+        path: 기록 파일 경로
+        name: 정책을 바꿀 냉장고 이름
+        policies: 비교할 정책 이름들 (기본은 전부)
+    """
+    replayer = TraceReplayer(path)
+    return {
+        policy: replayer.run(overrides={name: {"eviction_policy": policy}})
+        for policy in policies
+    }
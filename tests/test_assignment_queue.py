@@ -180,3 +180,52 @@ class TestAssignmentManager:
         # 첫날에 휴학했으므로 날짜가 증가하지 않아야 함
         assert manager.current_date == datetime.date(2023, 5, 15)
         assert manager.took_leave == True
+
+    def test_iter_days(self):
+        manager = AssignmentManager()
+        tuesday = datetime.date(2023, 5, 16)
+
+        days = manager.iter_days(start=tuesday)
+        event = next(days)
+
+        # 화요일에 과제가 추가되고, 여유가 있으니 미룸
+        assert event.date == tuesday
+        assert len(event.added) == 1
+        assert event.added[0].day == Date.TUESDAY
+        assert event.postponed == event.added
+        assert event.completed == []
+        assert event.backlog == 1
+        assert event.took_leave == False
+
+        # 다음 기록은 3일 뒤(금요일): 과제 2개를 모두 처리
+        event = next(days)
+        assert event.date == datetime.date(2023, 5, 19)
+        assert event.added[0].day == Date.FRIDAY
+        assert len(event.completed) == 2
+        assert event.backlog == 0
+
+    def test_iter_days_stops_on_leave(self):
+        manager = AssignmentManager()
+        manager.current_date = datetime.date(2023, 5, 15)
+
+        for _ in range(3):
+            assignment = AssignmentQueue(Date.TUESDAY, manager.current_date)
+            manager.assignment_queue.enqueue(assignment)
+
+        events = list(manager.iter_days())
+
+        # 휴학한 날의 기록만 나오고 끝나야 함
+        assert len(events) == 1
+        assert events[0].took_leave == True
+        assert events[0].backlog == 3
+        assert list(manager.iter_days()) == []
+
+    def test_iter_days_islice(self):
+        import itertools
+
+        manager = AssignmentManager()
+        events = list(itertools.islice(manager.iter_days(start=datetime.date(2023, 5, 15)), 4))
+
+        assert len(events) == 4
+        assert events[0].date == datetime.date(2023, 5, 15)
+        assert all(not e.took_leave for e in events)
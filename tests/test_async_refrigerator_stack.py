@@ -0,0 +1,161 @@
+import asyncio
+import pytest
+import random
+from muyaho.async_refrigerator_stack import AsyncRefrigeratorStack
+from muyaho.refrigerator_stack import FoodEatenException
+
+
+class FixedRandom(random.Random):
+    # 항상 같은 값을 돌려주는 난수 생성기
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+    def random(self):
+        return self.value
+
+
+def test_basic_stack_operations():
+    async def main():
+        fridge = AsyncRefrigeratorStack(expiry_time=10)
+        fridge.push("우유")
+        fridge.push("계란")
+
+        assert fridge.size() == 2
+        assert fridge.peek() == "계란"
+        assert fridge.pop() == "계란"
+        assert fridge.pop() == "우유"
+
+        with pytest.raises(IndexError):
+            fridge.pop()
+        fridge.close()
+
+    asyncio.run(main())
+
+
+def test_expiry_without_threads():
+    async def main():
+        fridge = AsyncRefrigeratorStack(expiry_time=0.2)
+        fridge.push("금방 상하는 음식")
+        assert fridge.size() == 1
+
+        await asyncio.sleep(0.3)
+        assert fridge.size() == 0
+        assert fridge._timer is None  # 냉장고가 비면 타이머도 없음
+
+    asyncio.run(main())
+
+
+def test_find_brings_expiry_forward():
+    async def main():
+        fridge = AsyncRefrigeratorStack(expiry_time=1, rng=FixedRandom(1.0))
+        fridge.push("치즈")
+        fridge.push("우유")
+
+        # 신선도 10 -> 2 이면 유통기한이 0.2초로 줄어듦
+        for _ in range(8):
+            fridge.find("치즈")
+        assert fridge.get_freshness("치즈") == 2
+
+        await asyncio.sleep(0.4)
+        assert fridge.find("치즈") is None
+        assert fridge.find("우유") == "우유"
+        fridge.close()
+
+    asyncio.run(main())
+
+
+def test_bulk_operations():
+    async def main():
+        fridge = AsyncRefrigeratorStack(max_size=200)
+        await fridge.push_many(range(150))
+        assert fridge.size() == 150
+
+        items = await fridge.pop_many(100)
+        assert items == list(range(149, 49, -1))
+        assert fridge.size() == 50
+        fridge.close()
+
+    asyncio.run(main())
+
+
+def test_wait_for():
+    async def main():
+        fridge = AsyncRefrigeratorStack()
+        fridge.push("우유")
+
+        # 이미 있으면 바로 반환
+        assert await fridge.wait_for(lambda x: x == "우유") == "우유"
+
+        waiter = asyncio.create_task(fridge.wait_for(lambda x: x.startswith("김치")))
+        await asyncio.sleep(0)
+        fridge.push("계란")
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        fridge.push("김치찌개")
+        assert await waiter == "김치찌개"
+        fridge.close()
+
+    asyncio.run(main())
+
+
+def test_eviction_policy():
+    async def main():
+        fridge = AsyncRefrigeratorStack(
+            max_size=2, eviction_policy="lru", rng=FixedRandom(1.0)
+        )
+        fridge.push("우유")
+        fridge.push("계란")
+        fridge.find("우유")
+        fridge.push("치즈")
+
+        assert fridge.find("계란") is None
+        assert fridge.find("우유") == "우유"
+        fridge.close()
+
+    asyncio.run(main())
+
+
+def test_duplicates_expire_and_evict_separately():
+    async def main():
+        fridge = AsyncRefrigeratorStack(expiry_time=0.2, max_size=2)
+        fridge.push("a")
+        fridge.push("a")
+        fridge.push("b")  # 아래쪽 "a"만 밀려남
+        assert await fridge.pop_many(2) == ["b", "a"]
+
+        fridge.push("a")
+        fridge.push("a")
+        await asyncio.sleep(0.3)
+        assert fridge.size() == 0  # 둘 다 유통기한이 지나야 함
+
+    asyncio.run(main())
+
+
+def test_reuse_across_event_loops():
+    # asyncio.run 을 여러 번 불러도 같은 냉장고를 쓸 수 있어야 함
+    fridge = AsyncRefrigeratorStack(expiry_time=0.2)
+
+    async def first():
+        fridge.push("우유")
+
+    async def second():
+        fridge.push("계란")  # 닫힌 루프에 타이머를 걸면 안 됨
+        assert fridge.size() == 2
+        await asyncio.sleep(0.3)
+        assert fridge.size() == 0
+
+    asyncio.run(first())
+    asyncio.run(second())
+
+
+def test_rng_decides_food_eaten():
+    async def main():
+        fridge = AsyncRefrigeratorStack(rng=FixedRandom(0.0))
+        fridge.push("우유")
+        with pytest.raises(FoodEatenException):
+            fridge.find("우유")
+        fridge.close()
+
+    asyncio.run(main())
@@ -0,0 +1,219 @@
+import os
+import pytest
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from muyaho import fridge_server
+from muyaho.fridge_server import FridgeServer, RefrigeratorClient
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(random, "random", lambda: 1.0)  # 랜덤 예외 없이
+    server = FridgeServer(str(tmp_path / "fridge.sock"), max_size=3)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_basic_operations(server):
+    with RefrigeratorClient(server.socket_path) as client:
+        client.push("우유")
+        client.push("계란")
+
+        assert client.size() == 2
+        assert client.peek() == "계란"
+        assert client.find("우유") == "우유"
+        assert client.get_freshness("우유") == 9
+        assert client.pop() == "계란"
+        assert client.size() == 1
+
+
+def test_clients_share_fridge(server):
+    # 같은 이름이면 같은 냉장고, 다른 이름이면 다른 냉장고
+    with RefrigeratorClient(server.socket_path) as a, RefrigeratorClient(
+        server.socket_path
+    ) as b, RefrigeratorClient(server.socket_path, name="김치냉장고") as c:
+        a.push("치즈")
+        assert b.peek() == "치즈"
+        assert c.size() == 0
+
+
+def test_fridge_options(server):
+    with RefrigeratorClient(server.socket_path, name="작은냉장고", max_size=1) as client:
+        client.push("우유")
+        client.push("계란")
+        assert client.size() == 1
+        assert client.peek() == "계란"
+
+
+def test_pipeline(server):
+    with RefrigeratorClient(server.socket_path) as client:
+        with client.pipeline() as pipe:
+            pipe.push("우유").push("계란").size().peek()
+        assert pipe.results == [None, None, 2, "계란"]
+
+
+def test_errors_are_raised_on_client(server):
+    with RefrigeratorClient(server.socket_path) as client:
+        with pytest.raises(IndexError):
+            client.pop()
+
+        # 예외가 나도 연결은 계속 쓸 수 있어야 함
+        client.push("우유")
+        assert client.size() == 1
+
+        with pytest.raises(TypeError):
+            client.find(lambda x: x == "우유")
+
+
+def test_default_socket_path_is_per_user(tmp_path, monkeypatch):
+    from muyaho.fridge_server import default_socket_path
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert default_socket_path() == str(tmp_path / "muyaho-fridge.sock")
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    assert f"muyaho-{os.getuid()}" in default_socket_path()
+
+
+def test_server_refuses_non_socket_file(tmp_path):
+    path = tmp_path / "fridge.sock"
+    path.write_text("중요한 파일")
+
+    with pytest.raises(FileExistsError):
+        FridgeServer(str(path))
+    assert path.read_text() == "중요한 파일"
+
+
+def test_server_replaces_only_stale_socket(tmp_path, server):
+    # 살아 있는 서버의 소켓은 뺏지 않음
+    with pytest.raises(OSError):
+        FridgeServer(server.socket_path)
+
+    # 듣는 서버가 없는 소켓 파일은 지우고 새로 만듦
+    path = str(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    FridgeServer(path).server_close()
+
+
+def test_client_refuses_other_users_server(server, monkeypatch):
+    monkeypatch.setattr(fridge_server, "_peer_uid", lambda sock: os.getuid() + 1)
+
+    with pytest.raises(PermissionError):
+        RefrigeratorClient(server.socket_path).size()
+
+
+def test_client_pool_is_fork_safe(server):
+    # 부모에서 만든 클라이언트를 fork 한 자식들이 같이 써도 응답이 섞이지 않아야 함
+    client = RefrigeratorClient(server.socket_path, name="포크", max_size=100)
+    client.push("부모")
+
+    pids = []
+    for worker in range(4):
+        pid = os.fork()
+        if pid == 0:
+            ok = True
+            try:
+                for i in range(50):
+                    ok &= client.get_freshness("부모") == 10
+                    ok &= client.find(f"없는음식{worker}-{i}") is None
+            except BaseException:
+                ok = False
+            os._exit(0 if ok else 1)
+        pids.append(pid)
+
+    for _ in range(50):
+        assert client.size() == 1
+    for pid in pids:
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+    client.close()
+
+
+def test_conflicting_fridge_options(server):
+    with RefrigeratorClient(server.socket_path, name="작은냉장고", max_size=1) as a:
+        a.push("우유")
+
+        # 같은 설정이면 같은 냉장고를 씀
+        with RefrigeratorClient(server.socket_path, name="작은냉장고", max_size=1) as b:
+            assert b.peek() == "우유"
+
+        # 다른 설정이면 조용히 무시하지 않고 에러
+        with pytest.raises(ValueError):
+            RefrigeratorClient(server.socket_path, name="작은냉장고", max_size=10)
+
+        # 옵션 없이 열면 있는 냉장고를 그대로 씀
+        with RefrigeratorClient(server.socket_path, name="작은냉장고") as c:
+            assert c.size() == 1
+
+
+def test_client_survives_server_restart(tmp_path):
+    path = str(tmp_path / "fridge.sock")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    def start():
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "muyaho.fridge_server", "--socket", path],
+            env=env,
+            stdout=subprocess.DEVNULL,
+        )
+        for _ in range(100):
+            try:
+                with socket.socket(socket.AF_UNIX) as probe:
+                    probe.connect(path)
+                return proc
+            except OSError:
+                time.sleep(0.05)
+        proc.kill()
+        raise RuntimeError("서버가 뜨지 않았어요")
+
+    proc = start()
+    try:
+        with RefrigeratorClient(path, pool_size=2) as client:
+            client.push("우유")
+            assert client.size() == 1
+
+            # 서버를 죽였다가 다시 띄우면 풀의 연결은 모두 죽음
+            proc.kill()
+            proc.wait()
+            proc = start()
+
+            # 죽은 연결 때문에 호출이 실패하면 안 됨
+            assert client.size() == 0
+            client.push("계란")
+            assert client.peek() == "계란"
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_eviction_policy_defaults_are_per_fridge(tmp_path):
+    from muyaho.eviction_policy import LRUPolicy
+
+    # 정책 객체는 냉장고끼리 공유되면 안 되니 이름으로만 받음
+    with pytest.raises(TypeError):
+        FridgeServer(str(tmp_path / "a.sock"), eviction_policy=LRUPolicy())
+    with pytest.raises(ValueError):
+        FridgeServer(str(tmp_path / "b.sock"), eviction_policy="lruu")
+
+    server = FridgeServer(str(tmp_path / "c.sock"), eviction_policy="lru")
+    try:
+        a, b = server.get_fridge("a"), server.get_fridge("b")
+        assert a._contents.eviction_policy is not b._contents.eviction_policy
+    finally:
+        server.server_close()
+
+
+def test_cli_rejects_unknown_eviction_policy(tmp_path):
+    with pytest.raises(SystemExit):
+        fridge_server.main(
+            ["--socket", str(tmp_path / "fridge.sock"), "--eviction-policy", "lruu"]
+        )
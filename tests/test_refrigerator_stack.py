@@ -1,5 +1,6 @@
 import pytest
 import time
+import random
 from muyaho.refrigerator_stack import RefrigeratorStack, FoodEatenException
 
 
@@ -115,3 +116,130 @@ def test_empty_fridge():
 
     with pytest.raises(IndexError):
         fridge.peek()
+
+
+def test_lru_eviction(monkeypatch):
+    # LRU 정책: 최근에 찾은 음식은 살아남음
+    monkeypatch.setattr(random, "random", lambda: 1.0)
+    fridge = RefrigeratorStack(max_size=3, eviction_policy="lru")
+    fridge.push("우유")
+    fridge.push("계란")
+    fridge.push("치즈")
+
+    fridge.find("우유")
+    fridge.push("김치")  # 가장 오래 안 찾은 "계란"이 밀려나야 함
+
+    assert fridge.find("계란") is None
+    assert fridge.find("우유") == "우유"
+    assert fridge.find("김치") == "김치"
+
+
+def test_lfu_eviction(monkeypatch):
+    # LFU 정책: 가장 적게 찾은 음식부터 버림, 같으면 오래된 것부터
+    monkeypatch.setattr(random, "random", lambda: 1.0)
+    fridge = RefrigeratorStack(max_size=3, eviction_policy="lfu")
+    fridge.push("우유")
+    fridge.push("계란")
+    fridge.push("치즈")
+
+    fridge.find("우유")
+    fridge.find("우유")
+    fridge.find("계란")
+    fridge.push("김치")  # 한 번도 안 찾은 "치즈"가 밀려나야 함
+
+    assert fridge.find("치즈") is None
+    assert fridge.size() == 3
+
+    fridge.push("두부")  # 이제 "김치"(0회)가 가장 적게 찾은 음식
+    assert fridge.find("김치") is None
+
+
+def test_least_fresh_eviction(monkeypatch):
+    # 신선도 정책: 가장 신선하지 않은 음식부터 버림, 같으면 오래된 것부터
+    monkeypatch.setattr(random, "random", lambda: 1.0)
+    fridge = RefrigeratorStack(max_size=3, eviction_policy="least_fresh")
+    fridge.push("우유")
+    fridge.push("계란")
+    fridge.push("치즈")
+
+    fridge.find("치즈")
+    fridge.push("김치")  # 신선도가 9로 떨어진 "치즈"가 밀려나야 함
+    assert fridge.get_freshness("치즈") == 0
+    assert fridge.get_freshness("우유") == 10
+
+    fridge.push("두부")  # 모두 신선도 10이면 가장 오래된 "우유"
+    assert fridge.get_freshness("우유") == 0
+    assert fridge.get_freshness("계란") == 10
+
+
+def test_pop_keeps_eviction_policy_in_sync(monkeypatch):
+    # pop 으로 꺼낸 음식은 제거 정책에서도 빠져야 함
+    monkeypatch.setattr(random, "random", lambda: 1.0)
+    fridge = RefrigeratorStack(max_size=2, eviction_policy="lru")
+    fridge.push("우유")
+    fridge.push("계란")
+    assert fridge.pop() == "계란"
+
+    fridge.push("치즈")
+    fridge.push("김치")  # "우유"가 밀려나야 함
+
+    assert fridge.size() == 2
+    assert fridge.find("우유") is None
+    assert fridge.peek() == "김치"
+
+
+def test_unknown_eviction_policy():
+    with pytest.raises(ValueError):
+        RefrigeratorStack(eviction_policy="random")
+
+
+def drain(fridge):
+    # 냉장고를 비우면서 아래부터 위 순서로 반환
+    items = []
+    while fridge.size():
+        items.append(fridge.pop())
+    return items[::-1]
+
+
+def test_fifo_eviction_with_duplicates():
+    # 같은 값을 여러 번 넣어도 넣은 순서대로 밀려나야 함
+    fridge = RefrigeratorStack(max_size=2)
+    for item in ("a", "a", "b", "c"):
+        fridge.push(item)
+
+    assert drain(fridge) == ["b", "c"]
+
+
+@pytest.mark.parametrize("policy", ["fifo", "lru", "lfu", "least_fresh"])
+def test_eviction_policies_with_duplicates(policy):
+    # 중복된 값도 각각 제거 정책이 관리해야 함
+    fridge = RefrigeratorStack(max_size=3, eviction_policy=policy)
+    for item in ("a", "a", "b", "c", "d", "e"):
+        fridge.push(item)
+
+    assert len(fridge._contents.eviction_policy) == 3
+    assert drain(fridge) == ["c", "d", "e"]
+    assert len(fridge._contents.eviction_policy) == 0
+
+
+def test_duplicates_have_separate_freshness(monkeypatch):
+    monkeypatch.setattr(random, "random", lambda: 1.0)
+    fridge = RefrigeratorStack(max_size=3, eviction_policy="least_fresh")
+    fridge.push("a")
+    fridge.push("a")
+    fridge.find("a")  # 아래쪽 "a"만 신선도가 떨어짐
+    fridge.push("b")
+    fridge.push("c")  # 신선도가 떨어진 아래쪽 "a"가 밀려나야 함
+
+    assert drain(fridge) == ["a", "b", "c"]
+
+
+def test_custom_eviction_policy_must_be_complete():
+    from muyaho.eviction_policy import EvictionPolicy
+
+    class HalfPolicy(EvictionPolicy):
+        def add(self, key, freshness):
+            pass
+
+    with pytest.raises(TypeError):
+        HalfPolicy()
@@ -0,0 +1,176 @@
+import random
+import time
+from muyaho.trace_replay import TraceRecorder, TraceReplayer, read_trace
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_record_and_replay_same_config(tmp_path):
+    path = str(tmp_path / "fridge.trace")
+    clock = FakeClock()
+
+    with TraceRecorder(path, clock=clock) as recorder:
+        fridge = recorder.track(
+            "fridge", "RefrigeratorStack", max_size=2, expiry_time=10, rng=random.Random(0)
+        )
+        fridge.push("우유")
+        fridge.push("계란")
+        fridge.push("치즈")  # "우유"가 밀려남
+        clock.now += 1
+        assert fridge.find("계란") == "계란"
+        assert fridge.find(lambda x: x == "치즈") == "치즈"  # 재생할 수 없는 연산
+        assert fridge.size() == 2
+
+    records = list(read_trace(path))
+    assert records[0][0] == "new"
+    assert [r[3] for r in records[1:]] == ["push", "push", "push", "find", "find", "size"]
+
+    report = TraceReplayer(path).run()
+    assert report.operations == 5
+    assert report.skipped == 1
+    assert report.diffs == []
+    assert report.trace_duration == 1
+
+
+def test_replay_with_other_config(tmp_path):
+    path = str(tmp_path / "fridge.trace")
+
+    with TraceRecorder(path, clock=FakeClock()) as recorder:
+        fridge = recorder.track(
+            "fridge", "RefrigeratorStack", max_size=2, rng=random.Random(0)
+        )
+        for item in ("우유", "계란", "치즈"):
+            fridge.push(item)
+        fridge.find("우유")
+
+    report = TraceReplayer(path).run(overrides={"fridge": {"max_size": 3}})
+
+    # 더 큰 냉장고에서는 "우유"가 남아 있음
+    find_diffs = [d for d in report.diffs if d.op == "find"]
+    assert len(find_diffs) == 1
+    assert find_diffs[0].recorded[0] == ("ok", None)
+    assert find_diffs[0].replayed[0] == ("ok", "우유")
+
+
+def test_replay_expiry_uses_trace_time(tmp_path):
+    path = str(tmp_path / "fridge.trace")
+    clock = FakeClock()
+
+    with TraceRecorder(path, clock=clock) as recorder:
+        fridge = recorder.track("fridge", "RefrigeratorStack", expiry_time=5)
+        fridge.push("우유")
+        clock.now += 10
+        assert fridge.size() == 0  # 기록 중에도 연산 직전에 유통기한 확인
+
+    # 같은 설정으로 재생하면 결과가 모두 같아야 함
+    report = TraceReplayer(path).run(speed=1000)
+    assert report.operations == 2
+    assert report.diffs == []
+
+
+def test_replay_matches_recording_on_real_clock(tmp_path):
+    path = str(tmp_path / "fridge.trace")
+
+    with TraceRecorder(path) as recorder:
+        fridge = recorder.track(
+            "fridge", "RefrigeratorStack", expiry_time=0.2, rng=random.Random(0)
+        )
+        fridge.push("우유")
+        fridge.push("계란")
+        fridge.get_expiry_time("우유")
+        fridge.find("계란")
+        fridge.get_expiry_time("계란")
+        time.sleep(0.3)
+        fridge.size()
+        try:
+            fridge.peek()
+        except IndexError:
+            pass
+
+    report = TraceReplayer(path).run()
+    assert report.operations == 7
+    assert report.diffs == []
+
+
+def test_coffee_queue_rng_draws_are_replayed(tmp_path):
+    path = str(tmp_path / "coffee.trace")
+
+    with TraceRecorder(path) as recorder:
+        queue = recorder.track(
+            "coffee", "CoffeeQueue", caffeine_threshold=1, rng=random.Random(42)
+        )
+        queue.enqueue_coffee("아메리카노")
+        for i in range(20):
+            queue.enqueue_task(f"과제{i}")
+        queue.process_tasks()
+        bounced = list(queue.bounced_tasks)
+
+    assert 0 < len(bounced) < 20
+
+    report = TraceReplayer(path).run()
+    assert report.diffs == []
+
+    # 임계치를 올리면 튕기는 과제가 없어짐
+    report = TraceReplayer(path).run(overrides={"coffee": {"caffeine_threshold": 2}})
+    assert [d.op for d in report.diffs] == ["process_tasks"]
+    assert report.diffs[0].replayed[1] == (1, 20, 0)
+
+
+def test_compare_eviction_policies(tmp_path):
+    from muyaho.trace_replay import compare_eviction_policies
+
+    path = str(tmp_path / "fridge.trace")
+
+    # "우유"만 계속 찾는 작업: LRU 는 우유를 지키고 FIFO 는 버림
+    with TraceRecorder(path, clock=FakeClock()) as recorder:
+        fridge = recorder.track(
+            "fridge", "RefrigeratorStack", max_size=3, rng=random.Random(0)
+        )
+        fridge.push("우유")
+        for i in range(10):
+            fridge.push(f"간식{i}")
+            fridge.find("우유")
+
+    reports = compare_eviction_policies(path, "fridge", ["fifo", "lru"])
+
+    assert reports["fifo"].hits + reports["fifo"].misses == 10
+    assert reports["fifo"].hit_rate == 0.2
+    assert reports["lru"].hit_rate == 1.0
+    assert reports["lru"].op_count["push"] == 11
+    assert reports["lru"].mean_op_time("push") > 0
+
+
+def test_replay_speed_must_be_positive(tmp_path):
+    import pytest
+
+    path = str(tmp_path / "fridge.trace")
+    with TraceRecorder(path, clock=FakeClock()) as recorder:
+        recorder.track("fridge", "RefrigeratorStack").push("우유")
+
+    for speed in (0, -1, float("nan")):
+        with pytest.raises(ValueError):
+            TraceReplayer(path).run(speed=speed)
+
+
+def test_closed_recorder_refuses_operations(tmp_path):
+    import pytest
+
+    path = str(tmp_path / "fridge.trace")
+    with TraceRecorder(path, clock=FakeClock()) as recorder:
+        fridge = recorder.track("fridge", "RefrigeratorStack")
+        fridge.push("우유")
+    assert recorder.closed
+
+    # 닫힌 뒤의 연산은 실행되지도 기록되지도 않음
+    with pytest.raises(ValueError, match="닫혔"):
+        fridge.push("계란")
+    with pytest.raises(ValueError, match="닫혔"):
+        recorder.track("coffee", "CoffeeQueue")
+    assert fridge._target.size() == 1
+    assert len(list(read_trace(path))) == 2